@@ -17,16 +17,19 @@ def load_text_from_file(file_path: str) -> str:
     Returns:
         텍스트 내용
     """
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
-    except UnicodeDecodeError:
-        # UTF-8 실패 시 다른 인코딩 시도
+    # 파일은 한 번만 읽고, 인코딩 시도는 메모리에서 디코딩으로 처리
+    raw = Path(file_path).read_bytes()
+
+    # UTF-8 실패 시 다른 인코딩 시도
+    for encoding in ('utf-8', 'cp949'):
         try:
-            with open(file_path, 'r', encoding='cp949') as f:
-                return f.read()
-        except:
-            raise ValueError(f"파일을 읽을 수 없습니다: {file_path}")
+            text = raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+        # 텍스트 모드 open()과 동일하게 줄바꿈을 \n으로 통일
+        return text.replace('\r\n', '\n').replace('\r', '\n')
+
+    raise ValueError(f"파일을 읽을 수 없습니다: {file_path}")
 
 
 def save_chunks_to_json(chunks: List[Any], output_path: str) -> None:
@@ -12,6 +12,7 @@ CHUNK_PREVIEW_LEN  = 300    # 디버그용 텍스트 미리보기 길이
 CHUNKS_PER_PAGE = 4                 # 한 페이지당 묶을 청크 수
 MAX_CONCURRENT_EMOTION_ANALYSIS = 3 # 감정 분석 동시 실행 수
 MAX_CONCURRENT_MUSIC_GENERATION = 1 # MusicGen 동시 실행 수 (모델 제약)
+MAX_CONCURRENT_PROMPT_GENERATION = 4 # 지역 음악 프롬프트(LLM) 동시 생성 수
 
 # 감정 분석 및 청크 분할 관련 상수
 SIGNIFICANCE_THRESHOLD = 3          # 감정 전환점 중요도 임계값 (1-5, 이 값 이상만 청크 분할)
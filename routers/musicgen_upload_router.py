@@ -1,5 +1,4 @@
 import os
-from typing import List, Dict, Any
 from fastapi import (
     APIRouter,
     UploadFile,
@@ -7,13 +6,14 @@ from fastapi import (
     Form,
     HTTPException,
 )
+from fastapi.responses import ORJSONResponse
 from services.model_manager import musicgen_manager
 from services.mysql_service import mysql_service
 from services import prompt_service
 from services.async_emotion_analysis import process_book_with_async_emotion_detection
 from services.async_music_generation import process_all_chunks_async
 from services.workflow_refactored import music_workflow_refactored
-from utils.file_utils import secure_filename
+from utils.file_utils import secure_filename, ensure_dir
 from utils.logger import log
 from config import GEN_DURATION, OUTPUT_DIR, CHUNKS_PER_PAGE
 import json
@@ -36,8 +36,7 @@ async def generate_music_optimized(
     # 디렉토리 설정
     book_dir = f"{user_name}/{book_title}"
     abs_book_dir = os.path.join(OUTPUT_DIR, book_dir)
-    if not os.path.exists(abs_book_dir):
-        os.makedirs(abs_book_dir)
+    ensure_dir(abs_book_dir)
 
     # 텍스트 읽기
     text = file.file.read().decode("utf-8")
@@ -54,22 +53,12 @@ async def generate_music_optimized(
     total_chunks = len(all_chunks)
     log(f"🎭 비동기 감정 분석 완료: 총 {total_chunks}개 청크 생성")
 
-    # 페이지별 청크 매핑 생성 (한 페이지당 고정 청크 수)
-    page_chunk_mapping = {}
-
-    for i, chunk in enumerate[Dict[str, Any]](all_chunks):
-        page_num = (i // CHUNKS_PER_PAGE) + 1
-        if page_num not in page_chunk_mapping:
-            page_chunk_mapping[page_num] = {
-                "start_index": i + 1,
-                "end_index": i + 1,
-                "chunk_count": 0
-            }
-        page_chunk_mapping[page_num]["end_index"] = i + 1
-        page_chunk_mapping[page_num]["chunk_count"] += 1
-        chunk["page"] = page_num
+    # 페이지 번호 부여 (한 페이지당 고정 청크 수 → 인덱스로 바로 계산)
+    for i, chunk in enumerate(all_chunks):
+        chunk["page"] = i // CHUNKS_PER_PAGE + 1
+    total_pages = (total_chunks + CHUNKS_PER_PAGE - 1) // CHUNKS_PER_PAGE
 
-    log(f"📄 페이지 구성: 총 {len(page_chunk_mapping)}페이지, 페이지당 {CHUNKS_PER_PAGE}개 청크")
+    log(f"📄 페이지 구성: 총 {total_pages}페이지, 페이지당 {CHUNKS_PER_PAGE}개 청크")
 
     # 모든 청크를 비동기 병렬 처리
     print(f"🎵 {total_chunks}개 청크 음악 생성 시작...")
@@ -78,12 +67,9 @@ async def generate_music_optimized(
     # 페이지별로 청크 그룹화 및 저장
     page_results = []
 
-    for page_num, mapping in page_chunk_mapping.items():
-        start_idx = mapping["start_index"] - 1  # 0-based index
-        end_idx = mapping["end_index"]
-
+    for page_num in range(1, total_pages + 1):
         # 해당 페이지의 청크들만 추출
-        page_chunks = chunk_metadata[start_idx:end_idx]
+        page_chunks = chunk_metadata[(page_num - 1) * CHUNKS_PER_PAGE:page_num * CHUNKS_PER_PAGE]
 
         if not page_chunks:
             page_results.append({
@@ -132,7 +118,7 @@ async def generate_music_optimized(
         "message": f"{book_title} 음악 생성 완료",
         "book_id": book_id,
         "text_length": text_length,
-        "total_pages": len(page_chunk_mapping),
+        "total_pages": total_pages,
         "total_chunks": total_chunks,
         "total_duration": total_duration,
         "successful_pages": successful_pages,
@@ -165,8 +151,7 @@ async def generate_music_v3(
     # Directory setup
     book_dir = f"{user_name}/{book_title}"
     abs_book_dir = os.path.join(OUTPUT_DIR, book_dir)
-    if not os.path.exists(abs_book_dir):
-        os.makedirs(abs_book_dir)
+    ensure_dir(abs_book_dir)
 
     # Text Extraction
     try:
@@ -189,21 +174,12 @@ async def generate_music_v3(
     total_chunks = len(all_chunks)
     log(f"🎭 Emotion Analysis Complete: {total_chunks} chunks")
 
-    # Page Mapping
-    page_chunk_mapping = {}
+    # Page Assignment (fixed chunks per page, derived from the index)
     for i, chunk in enumerate(all_chunks):
-        page_num = (i // CHUNKS_PER_PAGE) + 1
-        if page_num not in page_chunk_mapping:
-            page_chunk_mapping[page_num] = {
-                "start_index": i + 1,
-                "end_index": i + 1,
-                "chunk_count": 0
-            }
-        page_chunk_mapping[page_num]["end_index"] = i + 1
-        page_chunk_mapping[page_num]["chunk_count"] += 1
-        chunk["page"] = page_num
-
-    log(f"📄 Page Config: {len(page_chunk_mapping)} pages, {CHUNKS_PER_PAGE} chunks/page")
+        chunk["page"] = i // CHUNKS_PER_PAGE + 1
+    total_pages = (total_chunks + CHUNKS_PER_PAGE - 1) // CHUNKS_PER_PAGE
+
+    log(f"📄 Page Config: {total_pages} pages, {CHUNKS_PER_PAGE} chunks/page")
 
     # Async Music Generation
     print(f"🎵 Generating music for {total_chunks} chunks...")
@@ -212,10 +188,8 @@ async def generate_music_v3(
     # Save Results
     page_results = []
 
-    for page_num, mapping in page_chunk_mapping.items():
-        start_idx = mapping["start_index"] - 1
-        end_idx = mapping["end_index"]
-        page_chunks = chunk_metadata[start_idx:end_idx]
+    for page_num in range(1, total_pages + 1):
+        page_chunks = chunk_metadata[(page_num - 1) * CHUNKS_PER_PAGE:page_num * CHUNKS_PER_PAGE]
 
         if not page_chunks:
             page_results.append({
@@ -260,7 +234,7 @@ async def generate_music_v3(
         "message": f"{book_title} Music Generation Complete",
         "book_id": book_id,
         "text_length": text_length,
-        "total_pages": len(page_chunk_mapping),
+        "total_pages": total_pages,
         "total_chunks": total_chunks,
         "total_duration": total_duration,
         "successful_pages": successful_pages,
@@ -312,8 +286,7 @@ async def generate_music_with_langgraph(
     # Setup output directory
     book_dir = f"{user_name}/{book_title}"
     abs_book_dir = os.path.join(OUTPUT_DIR, book_dir)
-    if not os.path.exists(abs_book_dir):
-        os.makedirs(abs_book_dir)
+    ensure_dir(abs_book_dir)
 
     # Read and validate text
     text = file.file.read().decode("utf-8")
@@ -341,7 +314,8 @@ async def generate_music_with_langgraph(
         log(f"⚠️ Workflow completed with errors: {result['errors']}")
 
     # Return comprehensive result
-    return result
+    # Page summaries are plain JSON types: serialize with orjson, skipping jsonable_encoder
+    return ORJSONResponse(result)
 
 
 
@@ -1,12 +1,27 @@
 # services/repeat_track.py
-import os, math
-from pathlib import Path
-from pydub import AudioSegment
+import os, math, wave
+import numpy as np
 import logging
 
 logger = logging.getLogger(__name__)
 print("[repeat_track] loaded from", __file__)
 
+# sampwidth(byte) → numpy dtype (MusicGen/soundfile 출력은 PCM_16)
+_SAMPLE_DTYPES = {2: np.int16, 4: np.int32}
+
+
+def _read_wav(path: str):
+    """WAV 파일을 (params, (frames, channels) 배열)로 읽는다."""
+    with wave.open(path, "rb") as wf:
+        params = (wf.getnchannels(), wf.getsampwidth(), wf.getframerate())
+        raw = wf.readframes(wf.getnframes())
+    nchannels, sampwidth, _ = params
+    if sampwidth not in _SAMPLE_DTYPES:
+        raise ValueError(f"Unsupported sample width {sampwidth} bytes: {path}")
+    samples = np.frombuffer(raw, dtype=_SAMPLE_DTYPES[sampwidth])
+    return params, samples.reshape(-1, nchannels)
+
+
 def repeat_clips_to_length(
     folder: str,
     base_name: str = "regional_output_",
@@ -17,25 +32,32 @@ def repeat_clips_to_length(
 ):
 
     # ① 클립 로딩 ------------------------------------------------------
-    clips: list[AudioSegment] = []
+    # 모든 클립이 같은 포맷(MusicGen 출력)이므로 pydub/ffmpeg 없이 wave로 직접 읽는다
+    clips: list[np.ndarray] = []
+    params = None
     for idx in range(1, 9999):
         p = os.path.join(folder, f"{base_name}{idx}.wav")
         if not os.path.exists(p):
             break
-        c = AudioSegment.from_wav(p)
-        d = len(c)
-        print(f"[repeat_track] {p} → {d} ms")
-        if d == 0:
+        clip_params, c = _read_wav(p)
+        print(f"[repeat_track] {p} → {len(c) * 1000 // clip_params[2]} ms")
+        if len(c) == 0:
             logger.warning(f"[repeat_track] skip empty clip {p}")
             continue
+        if params is None:
+            params = clip_params
+        elif clip_params != params:
+            raise ValueError(f"WAV format mismatch: {p} {clip_params} != {params}")
         clips.append(c)
 
     if not clips:
         raise FileNotFoundError("No usable regional_output_*.wav found")
 
+    nchannels, sampwidth, framerate = params
+
     # ② clip_duration 자동 결정 ---------------------------------------
     if not clip_duration or clip_duration <= 0:
-        clip_duration = len(clips[0]) // 1000 or 1   # 1초 이상 보장
+        clip_duration = len(clips[0]) // framerate or 1   # 1초 이상 보장
         logger.warning(f"[repeat_track] clip_duration auto-set to {clip_duration}s")
 
     # ③ 반복 횟수 계산 --------------------------------------------------
@@ -43,16 +65,34 @@ def repeat_clips_to_length(
     logger.info(f"[repeat_track] repeats per clip = {repeats}")
 
     # ④ 클립 반복 & crossfade 보정 -------------------------------------
-    track = AudioSegment.silent(duration=0)
+    # 조각 리스트에 쌓아 두고 마지막에 한 번만 concatenate (반복 append 복사 방지)
+    crossfade_frames = crossfade_ms * framerate // 1000
+    pieces: list[np.ndarray] = []
     for clip in clips:
+        clip = clip.astype(np.float32)
         dur = len(clip)
-        cf  = crossfade_ms if crossfade_ms < dur else max(0, dur // 4)
+        cf = crossfade_frames if crossfade_frames < dur else max(0, dur // 4)
         for _ in range(repeats):
-            track = track.append(clip, crossfade=(0 if len(track) == 0 else cf))
+            if not pieces or cf == 0:
+                pieces.append(clip)
+                continue
+            prev = pieces[-1]
+            n = min(cf, len(prev))
+            fade_out = np.linspace(1.0, 0.0, n, dtype=np.float32)[:, None]
+            pieces[-1] = prev[:len(prev) - n]
+            pieces.append(prev[len(prev) - n:] * fade_out + clip[:n] * (1.0 - fade_out))
+            pieces.append(clip[n:])
 
     # ⑤ 자르기 & 저장 --------------------------------------------------
-    track = track[:target_sec * 1000]
+    track = np.concatenate(pieces)[:target_sec * framerate]
+    info = np.iinfo(_SAMPLE_DTYPES[sampwidth])
+    track = np.clip(np.rint(track), info.min, info.max).astype(_SAMPLE_DTYPES[sampwidth])
+
     out_path = os.path.join(folder, output_name)
-    track.export(out_path, "wav")
-    logger.info(f"[repeat_track] saved {out_path} ({len(track)} ms)")
+    with wave.open(out_path, "wb") as wf:
+        wf.setnchannels(nchannels)
+        wf.setsampwidth(sampwidth)
+        wf.setframerate(framerate)
+        wf.writeframes(track.tobytes())
+    logger.info(f"[repeat_track] saved {out_path} ({len(track) * 1000 // framerate} ms)")
     return out_path
@@ -7,16 +7,18 @@
 import asyncio
 import time
 import os
-from typing import List, Dict, Any
+from typing import AsyncIterator, List, Dict, Any, Union
 from services import prompt_service, musicgen_service
+from services.types import TextChunk
 from utils.logger import log
+from utils.file_utils import save_text_to_file_async
 from config import GEN_DURATION, OUTPUT_DIR, MAX_CONCURRENT_MUSIC_GENERATION
 
 # MAX_CONCURRENT_MUSIC_GENERATION 값은 config.py에서 관리합니다.
 
 
 async def process_single_chunk(
-    chunk_data: Dict[str, Any],
+    chunk_data: Union[Dict[str, Any], TextChunk],
     chunk_index: int,
     book_relative_dir: str,
     global_prompt: str,
@@ -24,6 +26,10 @@ async def process_single_chunk(
     """단일 청크를 처리하여 오디오/텍스트 파일을 생성하고 메타데이터를 반환합니다."""
     start_time = time.time()
     try:
+        # 워크플로우는 TextChunk 모델을 그대로 넘기므로 이 태스크 안에서 한 번만 dict로 변환
+        if isinstance(chunk_data, TextChunk):
+            chunk_data = chunk_data.model_dump(mode="python")
+
         chunk_text = chunk_data["text"]
         chunk_context = chunk_data.get("context", {})
         
@@ -65,8 +71,7 @@ async def process_single_chunk(
         
         # 텍스트 청크 파일 저장
         chunk_text_file = os.path.join(OUTPUT_DIR, f"{book_relative_dir}/chunk_{chunk_index}/chunk_{chunk_index}.txt")
-        with open(chunk_text_file, 'w', encoding='utf-8') as f:
-            f.write(chunk_text)
+        await save_text_to_file_async(chunk_text_file, chunk_text)
         
         elapsed_time = time.time() - start_time
         log(f"✅ 청크 {chunk_index} 음악 생성 및 텍스트 저장 완료 ({elapsed_time:.2f}초)")
@@ -94,48 +99,60 @@ async def process_single_chunk(
         }
 
 
-async def process_all_chunks_async(
-    all_chunks: List[Dict[str, Any]],
+async def iter_chunks_async(
+    all_chunks: List[Union[Dict[str, Any], TextChunk]],
     book_relative_dir: str,
     global_prompt: str,
-) -> List[Dict[str, Any]]:
-    """모든 청크를 비동기로 처리합니다. 동시성은 세마포어로 제한합니다."""
-    total_chunks = len(all_chunks)
-    log(f"🚀 {total_chunks}개 청크를 비동기로 병렬 처리 시작...")
-    
-    start_time = time.time()
-    
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    모든 청크를 비동기로 처리하면서, 성공한 청크 메타데이터를 원래 순서대로 하나씩 yield 합니다.
+    앞쪽 청크가 끝나는 즉시 소비자(DB 저장 등)가 작업을 시작할 수 있습니다.
+    """
     # 동시성 제한을 위한 세마포어
     semaphore = asyncio.Semaphore(MAX_CONCURRENT_MUSIC_GENERATION)
-    
-    async def limited_process_chunk(chunk_data: Dict[str, Any], chunk_index: int):
+
+    async def limited_process_chunk(chunk_data: Union[Dict[str, Any], TextChunk], chunk_index: int):
         """동시성 제한이 적용된 청크 처리"""
         async with semaphore:
             return await process_single_chunk(chunk_data, chunk_index, book_relative_dir, global_prompt)
-    
-    # 모든 청크를 동시에 처리 (동시성 제한 적용)
+
+    # 모든 청크를 동시에 예약 (동시성 제한 적용)
     tasks = [
-        limited_process_chunk(chunk, idx + 1)
+        asyncio.create_task(limited_process_chunk(chunk, idx + 1))
         for idx, chunk in enumerate(all_chunks)
     ]
+
+    try:
+        for task in tasks:
+            try:
+                result = await task
+            except Exception as e:
+                log(f"❌ 청크 처리 중 예외 발생: {e}")
+                continue
+            if result.get("success", False):
+                yield result
+    finally:
+        # 소비자가 중간에 멈추면 남은 작업 취소
+        for task in tasks:
+            task.cancel()
+
+
+async def process_all_chunks_async(
+    all_chunks: List[Union[Dict[str, Any], TextChunk]],
+    book_relative_dir: str,
+    global_prompt: str,
+) -> List[Dict[str, Any]]:
+    """모든 청크를 비동기로 처리합니다. 동시성은 세마포어로 제한합니다."""
+    total_chunks = len(all_chunks)
+    log(f"🚀 {total_chunks}개 청크를 비동기로 병렬 처리 시작...")
     
-    # 비동기 병렬 실행
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    
-    # 결과 정리
-    successful_chunks = []
-    failed_count = 0
-    total_processing_time = 0
-    
-    for result in results:
-        if isinstance(result, Exception):
-            failed_count += 1
-            log(f"❌ 청크 처리 중 예외 발생: {result}")
-        elif result.get("success", False):
-            successful_chunks.append(result)
-            total_processing_time += result.get("processing_time", 0)
-        else:
-            failed_count += 1
+    start_time = time.time()
+
+    successful_chunks = [
+        result
+        async for result in iter_chunks_async(all_chunks, book_relative_dir, global_prompt)
+    ]
+    failed_count = total_chunks - len(successful_chunks)
     
     elapsed_time = time.time() - start_time
     log(f"✅ 청크 처리 완료: 성공 {len(successful_chunks)}개, 실패 {failed_count}개 (총 {elapsed_time:.2f}초)")
@@ -5,7 +5,7 @@ This service follows SOLID principles and separates concerns properly.
 """
 
 import asyncio
-from typing import List, Dict, Any
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from services.types import (
     EmotionAnalysisRequest,
     EmotionAnalysisResult,
@@ -244,50 +244,69 @@ class EmotionAnalysisService:
 
         return enriched_phases
 
-    async def analyze_batch(
+    async def analyze_stream(
         self,
         segments: List[str],
         max_concurrent: int = MAX_CONCURRENT_EMOTION_ANALYSIS
-    ) -> List[Result]:
+    ) -> AsyncIterator[Tuple[int, Result]]:
         """
-        Analyze multiple segments concurrently with rate limiting.
+        Analyze multiple segments concurrently, yielding results as they finish.
 
         Args:
             segments: List of text segments to analyze
             max_concurrent: Maximum concurrent analyses
 
-        Returns:
-            List of Results (one per segment)
+        Yields:
+            (segment index, Result) pairs in completion order
         """
-        log(f"🎭 Batch analysis: {len(segments)} segments "
+        log(f"🎭 Streaming analysis: {len(segments)} segments "
             f"(concurrency: {max_concurrent})")
 
         semaphore = asyncio.Semaphore(max_concurrent)
 
-        async def analyze_with_limit(segment: str, index: int) -> Result:
+        async def analyze_with_limit(segment: str, index: int) -> Tuple[int, Result]:
             async with semaphore:
                 log(f"📊 Analyzing segment {index + 1}/{len(segments)}")
-                return await self.analyze_segment(segment)
+                try:
+                    return index, await self.analyze_segment(segment)
+                except Exception as e:
+                    # Convert exceptions to Results
+                    return index, Result.fail(
+                        error=f"Segment {index} analysis failed: {str(e)}",
+                        error_code=ErrorCode.EMOTION_ANALYSIS_FAILED
+                    )
 
         tasks = [
-            analyze_with_limit(seg, i)
+            asyncio.create_task(analyze_with_limit(seg, i))
             for i, seg in enumerate(segments)
         ]
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Consumer stopped early - don't leave LLM calls running
+            for task in tasks:
+                task.cancel()
 
-        # Convert exceptions to Results
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                processed_results.append(
-                    Result.fail(
-                        error=f"Segment {i} analysis failed: {str(result)}",
-                        error_code=ErrorCode.EMOTION_ANALYSIS_FAILED
-                    )
-                )
-            else:
-                processed_results.append(result)
+    async def analyze_batch(
+        self,
+        segments: List[str],
+        max_concurrent: int = MAX_CONCURRENT_EMOTION_ANALYSIS
+    ) -> List[Result]:
+        """
+        Analyze multiple segments concurrently with rate limiting.
+
+        Args:
+            segments: List of text segments to analyze
+            max_concurrent: Maximum concurrent analyses
+
+        Returns:
+            List of Results (one per segment, in segment order)
+        """
+        processed_results: List[Optional[Result]] = [None] * len(segments)
+        async for i, result in self.analyze_stream(segments, max_concurrent):
+            processed_results[i] = result
 
         successful = sum(1 for r in processed_results if r.is_ok())
         log(f"✅ Batch complete: {successful}/{len(segments)} successful")
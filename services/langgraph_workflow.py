@@ -1,10 +1,12 @@
 import asyncio
-from typing import Dict, Any, List, TypedDict
+import operator
+from typing import Annotated, Dict, Any, List, TypedDict
 from langgraph.graph import StateGraph, END
 from services.split_text import split_text_with_sliding_window
 from services.analyze_emotions_with_gpt import EmotionAnalysisResult, analyze_emotions_with_gpt
 from services.async_music_generation import process_all_chunks_async
 from services.mysql_service import mysql_service
+from services.types import merge_dicts
 from services import prompt_service
 from utils.logger import log
 from config import (
@@ -37,9 +39,9 @@ class WorkflowState(TypedDict):
     total_duration: int
     successful_pages: int
     
-    # 메타데이터
-    processing_times: Dict[str, float]
-    errors: List[str]
+    # 메타데이터 (노드는 변경분만 반환하고 리듀서가 병합)
+    processing_times: Annotated[Dict[str, float], merge_dicts]
+    errors: Annotated[List[str], operator.add]
 
 
 class MusicGenerationWorkflow:
@@ -90,16 +92,14 @@ class MusicGenerationWorkflow:
             log(f"✅ LangGraph: 텍스트 분리 완료 - {len(physical_chunks)}개 청크 ({elapsed_time:.2f}초)")
             
             return {
-                **state,
                 "physical_chunks": physical_chunks,
-                "processing_times": {**state.get("processing_times", {}), "split_text": elapsed_time}
+                "processing_times": {"split_text": elapsed_time}
             }
             
         except Exception as e:
             log(f"❌ LangGraph: 텍스트 분리 실패 - {e}")
             return {
-                **state,
-                "errors": state.get("errors", []) + [f"텍스트 분리 실패: {e}"]
+                "errors": [f"텍스트 분리 실패: {e}"]
             }
     
     async def _analyze_emotions_node(self, state: WorkflowState) -> WorkflowState:
@@ -141,16 +141,14 @@ class MusicGenerationWorkflow:
             log(f"✅ LangGraph: 감정 분석 완료 - 성공 {successful_count}/{len(emotion_analyses)}개 ({elapsed_time:.2f}초)")
             
             return {
-                **state,
                 "emotion_analyses": emotion_analyses,
-                "processing_times": {**state.get("processing_times", {}), "analyze_emotions": elapsed_time}
+                "processing_times": {"analyze_emotions": elapsed_time}
             }
             
         except Exception as e:
             log(f"❌ LangGraph: 감정 분석 실패 - {e}")
             return {
-                **state,
-                "errors": state.get("errors", []) + [f"감정 분석 실패: {e}"]
+                "errors": [f"감정 분석 실패: {e}"]
             }
     
     async def _create_final_chunks_node(self, state: WorkflowState) -> WorkflowState:
@@ -268,9 +266,8 @@ class MusicGenerationWorkflow:
             log(f"   - 소요시간: {elapsed_time:.2f}초")
 
             return {
-                **state,
                 "final_chunks": final_chunks,
-                "processing_times": {**state.get("processing_times", {}), "create_final_chunks": elapsed_time}
+                "processing_times": {"create_final_chunks": elapsed_time}
             }
 
         except Exception as e:
@@ -278,8 +275,7 @@ class MusicGenerationWorkflow:
             import traceback
             log(f"   스택 트레이스: {traceback.format_exc()}")
             return {
-                **state,
-                "errors": state.get("errors", []) + [f"최종 청크 생성 실패: {e}"]
+                "errors": [f"최종 청크 생성 실패: {e}"]
             }
     
     async def _generate_music_node(self, state: WorkflowState) -> WorkflowState:
@@ -304,16 +300,14 @@ class MusicGenerationWorkflow:
             log(f"✅ LangGraph: 음악 생성 완료 - {len(chunk_metadata)}개 성공 ({elapsed_time:.2f}초)")
             
             return {
-                **state,
                 "chunk_metadata": chunk_metadata,
-                "processing_times": {**state.get("processing_times", {}), "generate_music": elapsed_time}
+                "processing_times": {"generate_music": elapsed_time}
             }
             
         except Exception as e:
             log(f"❌ LangGraph: 음악 생성 실패 - {e}")
             return {
-                **state,
-                "errors": state.get("errors", []) + [f"음악 생성 실패: {e}"]
+                "errors": [f"음악 생성 실패: {e}"]
             }
     
     async def _create_page_mapping_node(self, state: WorkflowState) -> WorkflowState:
@@ -343,16 +337,14 @@ class MusicGenerationWorkflow:
             log(f"✅ LangGraph: 페이지 매핑 생성 완료 - {len(page_chunk_mapping)}페이지 ({elapsed_time:.2f}초)")
             
             return {
-                **state,
                 "page_chunk_mapping": page_chunk_mapping,
-                "processing_times": {**state.get("processing_times", {}), "create_page_mapping": elapsed_time}
+                "processing_times": {"create_page_mapping": elapsed_time}
             }
             
         except Exception as e:
             log(f"❌ LangGraph: 페이지 매핑 생성 실패 - {e}")
             return {
-                **state,
-                "errors": state.get("errors", []) + [f"페이지 매핑 생성 실패: {e}"]
+                "errors": [f"페이지 매핑 생성 실패: {e}"]
             }
     
     async def _save_to_database_node(self, state: WorkflowState) -> WorkflowState:
@@ -412,18 +404,16 @@ class MusicGenerationWorkflow:
             log(f"✅ LangGraph: DB 저장 완료 - {successful_pages}페이지 성공 ({elapsed_time:.2f}초)")
             
             return {
-                **state,
                 "page_results": page_results,
                 "total_duration": total_duration,
                 "successful_pages": successful_pages,
-                "processing_times": {**state.get("processing_times", {}), "save_to_database": elapsed_time}
+                "processing_times": {"save_to_database": elapsed_time}
             }
             
         except Exception as e:
             log(f"❌ LangGraph: DB 저장 실패 - {e}")
             return {
-                **state,
-                "errors": state.get("errors", []) + [f"DB 저장 실패: {e}"]
+                "errors": [f"DB 저장 실패: {e}"]
             }
     
     async def run_workflow(self, text: str, user_name: str, book_title: str, book_id: str, book_dir: str) -> Dict[str, Any]:
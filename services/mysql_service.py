@@ -4,8 +4,9 @@ MySQL 데이터베이스 서비스
 """
 
 from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
-from typing import List, Dict, Any, Optional
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
+from typing import Iterator, List, Dict, Any, Optional, Tuple
+from contextlib import contextmanager
 import os
 from dotenv import load_dotenv
 
@@ -26,13 +27,30 @@ try:
         pool_pre_ping=True,  # 연결 끊김 자동 복구
         pool_recycle=3600,  # 1시간마다 연결 재생성
     )
-    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    # 스레드별 세션 재사용 (요청마다 Session 객체를 새로 만들지 않음)
+    SessionLocal = scoped_session(
+        sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    )
     print("[MySQL] ✅ 데이터베이스 연결 성공")
 except Exception as e:
     print(f"[MySQL] ❌ 연결 실패: {e}")
     raise
 
 
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """
+    현재 스레드의 세션으로 트랜잭션 하나를 실행
+    정상 종료 시 commit, 예외 발생 시 rollback 후 커넥션을 풀에 반환
+    """
+    session = SessionLocal()
+    try:
+        with session.begin():
+            yield session
+    finally:
+        session.close()
+
+
 class MySQLService:
     """MySQL 데이터베이스 작업을 처리하는 서비스 클래스"""
 
@@ -57,87 +75,126 @@ class MySQLService:
         Returns:
             chapter_id: 생성된 챕터 ID
         """
-        session = SessionLocal()
         try:
-            # 0) 책 데이터 먼저 생성 (없으면 생성)
-            user_id = book_id.split('_')[0] if '_' in book_id else "unknown"
-            session.execute(
-                text("""
-                    INSERT INTO books (id, user_id, title)
-                    VALUES (:book_id, :user_id, :title)
-                    ON DUPLICATE KEY UPDATE updated_at = CURRENT_TIMESTAMP
-                """),
-                {
-                    "book_id": book_id,
-                    "user_id": user_id,
-                    "title": book_title or book_id
-                }
-            )
-            session.commit()
-
-            # 1) 챕터 저장 (이미 있으면 업데이트)
-            session.execute(
-                text("""
-                    INSERT INTO chapters (book_id, page, total_duration)
-                    VALUES (:book_id, :page, :duration)
-                    ON DUPLICATE KEY UPDATE 
-                        total_duration = :duration,
-                        updated_at = CURRENT_TIMESTAMP
-                """),
-                {"book_id": book_id, "page": page, "duration": total_duration}
-            )
-            session.commit()
-
-            # 챕터 ID 가져오기
-            chapter = session.execute(
-                text("SELECT id FROM chapters WHERE book_id = :book_id AND page = :page"),
-                {"book_id": book_id, "page": page}
-            ).fetchone()
+            with session_scope() as session:
+                MySQLService._upsert_book(session, book_id, book_title)
+                return MySQLService._save_chapter_chunks(
+                    session, book_id, page, chunks, total_duration
+                )
+        except Exception as e:
+            print(f"[MySQL] ❌ 저장 실패: {e}")
+            raise e
 
-            if not chapter:
-                raise Exception(f"챕터 생성 실패: {book_id}, page {page}")
+    @staticmethod
+    def save_chapter_chunks_bulk(
+        book_id: str,
+        pages: List[Tuple[int, List[Dict[str, Any]], int]],
+        book_title: str = "",
+    ) -> List[int]:
+        """
+        여러 페이지의 챕터/청크 데이터를 한 트랜잭션으로 저장
+        
+        Args:
+            book_id: 책 ID
+            pages: (페이지 번호, 청크 데이터 리스트, 전체 음악 길이) 튜플 리스트
+            book_title: 책 제목 (선택)
+        
+        Returns:
+            pages 순서대로 생성된 챕터 ID 리스트
+        """
+        try:
+            with session_scope() as session:
+                MySQLService._upsert_book(session, book_id, book_title)
+                return [
+                    MySQLService._save_chapter_chunks(
+                        session, book_id, page, chunks, total_duration
+                    )
+                    for page, chunks, total_duration in pages
+                ]
+        except Exception as e:
+            print(f"[MySQL] ❌ 일괄 저장 실패: {e}")
+            raise e
 
-            chapter_id = chapter[0]
-            print(f"[MySQL] 📖 챕터 저장 완료: chapter_id={chapter_id}, book={book_id}, page={page}")
+    @staticmethod
+    def _upsert_book(session: Session, book_id: str, book_title: str) -> None:
+        """책 데이터 생성 (이미 있으면 updated_at만 갱신)"""
+        user_id = book_id.split('_')[0] if '_' in book_id else "unknown"
+        session.execute(
+            text("""
+                INSERT INTO books (id, user_id, title)
+                VALUES (:book_id, :user_id, :title)
+                ON DUPLICATE KEY UPDATE updated_at = CURRENT_TIMESTAMP
+            """),
+            {
+                "book_id": book_id,
+                "user_id": user_id,
+                "title": book_title or book_id
+            }
+        )
 
-            # 2) 기존 청크 삭제 (재생성 방지)
+    @staticmethod
+    def _save_chapter_chunks(
+        session: Session,
+        book_id: str,
+        page: int,
+        chunks: List[Dict[str, Any]],
+        total_duration: int,
+    ) -> int:
+        """챕터 1개와 청크 저장 (호출자가 트랜잭션과 책 데이터를 관리)"""
+        # 1) 챕터 저장 (이미 있으면 업데이트)
+        # id = LAST_INSERT_ID(id): 업데이트된 경우에도 lastrowid가 기존 챕터 ID를 가리키게 함
+        result = session.execute(
+            text("""
+                INSERT INTO chapters (book_id, page, total_duration)
+                VALUES (:book_id, :page, :duration)
+                ON DUPLICATE KEY UPDATE 
+                    id = LAST_INSERT_ID(id),
+                    total_duration = :duration,
+                    updated_at = CURRENT_TIMESTAMP
+            """),
+            {"book_id": book_id, "page": page, "duration": total_duration}
+        )
+
+        chapter_id = result.lastrowid
+        if not chapter_id:
+            raise Exception(f"챕터 생성 실패: {book_id}, page {page}")
+
+        print(f"[MySQL] 📖 챕터 저장 완료: chapter_id={chapter_id}, book={book_id}, page={page}")
+
+        # 2) 기존 청크 삭제 (재생성 방지)
+        session.execute(
+            text("DELETE FROM chunks WHERE chapter_id = :chapter_id"),
+            {"chapter_id": chapter_id}
+        )
+
+        # 3) 새 청크 저장 (executemany로 한 번에 INSERT)
+        rows = [
+            {
+                "chapter_id": chapter_id,
+                "idx": chunk["index"],
+                "text": chunk["fullText"],
+                "preview": chunk["text"][:500],
+                "emotion": chunk["emotion"],
+                "audio_url": chunk["audioUrl"],
+                "duration": chunk.get("duration", 30.0)
+            }
+            for chunk in chunks
+        ]
+        if rows:
             session.execute(
-                text("DELETE FROM chunks WHERE chapter_id = :chapter_id"),
-                {"chapter_id": chapter_id}
+                text("""
+                    INSERT INTO chunks 
+                    (chapter_id, chunk_index, text_content, text_preview, 
+                     emotion, audio_url, audio_duration)
+                    VALUES (:chapter_id, :idx, :text, :preview, 
+                            :emotion, :audio_url, :duration)
+                """),
+                rows
             )
 
-            # 3) 새 청크 저장
-            for chunk in chunks:
-                session.execute(
-                    text("""
-                        INSERT INTO chunks 
-                        (chapter_id, chunk_index, text_content, text_preview, 
-                         emotion, audio_url, audio_duration)
-                        VALUES (:chapter_id, :idx, :text, :preview, 
-                                :emotion, :audio_url, :duration)
-                    """),
-                    {
-                        "chapter_id": chapter_id,
-                        "idx": chunk["index"],
-                        "text": chunk["fullText"],
-                        "preview": chunk["text"][:500] if len(chunk["text"]) > 500 else chunk["text"],
-                        "emotion": chunk["emotion"],
-                        "audio_url": chunk["audioUrl"],
-                        "duration": chunk.get("duration", 30.0)
-                    }
-                )
-
-            session.commit()
-            print(f"[MySQL] 🎵 청크 {len(chunks)}개 저장 완료")
+        print(f"[MySQL] 🎵 청크 {len(chunks)}개 저장 완료")
 
-            return chapter_id
-
-        except Exception as e:
-            session.rollback()
-            print(f"[MySQL] ❌ 저장 실패: {e}")
-            raise e
-        finally:
-            session.close()
+        return chapter_id
 
     @staticmethod
     def get_chapter_chunks(book_id: str, page: int) -> Optional[Dict[str, Any]]:
@@ -151,67 +208,64 @@ class MySQLService:
         Returns:
             챕터 데이터 (청크 리스트 포함) 또는 None
         """
-        session = SessionLocal()
         try:
-            # 챕터 조회
-            chapter = session.execute(
-                text("""
-                    SELECT id, total_duration, created_at
-                    FROM chapters 
-                    WHERE book_id = :book_id AND page = :page
-                """),
-                {"book_id": book_id, "page": page}
-            ).fetchone()
-
-            if not chapter:
-                print(f"[MySQL] ⚠️ 챕터 없음: {book_id}, page {page}")
-                return None
-
-            chapter_id, total_duration, created_at = chapter
+            with session_scope() as session:
+                # 챕터 조회
+                chapter = session.execute(
+                    text("""
+                        SELECT id, total_duration, created_at
+                        FROM chapters 
+                        WHERE book_id = :book_id AND page = :page
+                    """),
+                    {"book_id": book_id, "page": page}
+                ).fetchone()
 
-            # 청크 조회 (순서대로)
-            chunks = session.execute(
-                text("""
-                    SELECT chunk_index, text_content, text_preview, 
-                           emotion, audio_url, audio_duration
-                    FROM chunks
-                    WHERE chapter_id = :chapter_id
-                    ORDER BY chunk_index ASC
-                """),
-                {"chapter_id": chapter_id}
-            ).fetchall()
+                if not chapter:
+                    print(f"[MySQL] ⚠️ 챕터 없음: {book_id}, page {page}")
+                    return None
 
-            print(f"[MySQL] ✅ 조회 성공: {book_id}, page {page}, 청크 {len(chunks)}개")
+                chapter_id, total_duration, created_at = chapter
 
-            return {
-                "page": page,
-                "bookId": book_id,
-                "totalDuration": total_duration,
-                "createdAt": created_at.isoformat() if created_at else None,
-                "chunks": [
-                    {
-                        "index": row[0],
-                        "fullText": row[1],
-                        "text": row[2],
-                        "emotion": row[3],
-                        "audioUrl": row[4],
-                        "duration": row[5]
-                    }
-                    for row in chunks
-                ]
-            }
+                # 청크 조회 (순서대로)
+                chunks = session.execute(
+                    text("""
+                        SELECT chunk_index, text_content, text_preview, 
+                               emotion, audio_url, audio_duration
+                        FROM chunks
+                        WHERE chapter_id = :chapter_id
+                        ORDER BY chunk_index ASC
+                    """),
+                    {"chapter_id": chapter_id}
+                ).fetchall()
+
+                print(f"[MySQL] ✅ 조회 성공: {book_id}, page {page}, 청크 {len(chunks)}개")
+
+                return {
+                    "page": page,
+                    "bookId": book_id,
+                    "totalDuration": total_duration,
+                    "createdAt": created_at.isoformat() if created_at else None,
+                    "chunks": [
+                        {
+                            "index": row[0],
+                            "fullText": row[1],
+                            "text": row[2],
+                            "emotion": row[3],
+                            "audioUrl": row[4],
+                            "duration": row[5]
+                        }
+                        for row in chunks
+                    ]
+                }
 
         except Exception as e:
             print(f"[MySQL] ❌ 조회 실패: {e}")
             return None
-        finally:
-            session.close()
 
     @staticmethod
     def get_all_chapters(book_id: str) -> List[Dict[str, Any]]:
         """책의 모든 챕터 목록 조회"""
-        session = SessionLocal()
-        try:
+        with session_scope() as session:
             chapters = session.execute(
                 text("""
                     SELECT page, total_duration, 
@@ -234,9 +288,6 @@ class MySQLService:
                 for row in chapters
             ]
 
-        finally:
-            session.close()
-
     @staticmethod
     def get_user_books(user_id: str) -> List[Dict[str, Any]]:
         """
@@ -248,58 +299,55 @@ class MySQLService:
         Returns:
             사용자의 책 목록 (각 책의 페이지 수, 총 청크 수 포함)
         """
-        session = SessionLocal()
         try:
-            books = session.execute(
-                text("""
-                    SELECT 
-                        b.id,
-                        b.title,
-                        b.author,
-                        b.created_at,
-                        b.updated_at,
-                        COUNT(DISTINCT c.page) as total_pages,
-                        COUNT(DISTINCT ch.id) as total_chunks,
-                        SUM(c.total_duration) as total_duration
-                    FROM books b
-                    LEFT JOIN chapters c ON b.id = c.book_id
-                    LEFT JOIN chunks ch ON c.id = ch.chapter_id
-                    WHERE b.user_id = :user_id
-                    GROUP BY b.id, b.title, b.author, b.created_at, b.updated_at
-                    ORDER BY b.updated_at DESC
-                """),
-                {"user_id": user_id}
-            ).fetchall()
+            with session_scope() as session:
+                books = session.execute(
+                    text("""
+                        SELECT 
+                            b.id,
+                            b.title,
+                            b.author,
+                            b.created_at,
+                            b.updated_at,
+                            COUNT(DISTINCT c.page) as total_pages,
+                            COUNT(DISTINCT ch.id) as total_chunks,
+                            SUM(c.total_duration) as total_duration
+                        FROM books b
+                        LEFT JOIN chapters c ON b.id = c.book_id
+                        LEFT JOIN chunks ch ON c.id = ch.chapter_id
+                        WHERE b.user_id = :user_id
+                        GROUP BY b.id, b.title, b.author, b.created_at, b.updated_at
+                        ORDER BY b.updated_at DESC
+                    """),
+                    {"user_id": user_id}
+                ).fetchall()
 
-            print(f"[MySQL] 📚 {user_id} 사용자의 책 {len(books)}권 조회")
+                print(f"[MySQL] 📚 {user_id} 사용자의 책 {len(books)}권 조회")
 
-            return [
-                {
-                    "bookId": row[0],
-                    "title": row[1],
-                    "author": row[2],
-                    "createdAt": row[3].isoformat() if row[3] else None,
-                    "updatedAt": row[4].isoformat() if row[4] else None,
-                    "totalPages": row[5] or 0,
-                    "totalChunks": row[6] or 0,
-                    "totalDuration": float(row[7]) if row[7] else 0,
-                }
-                for row in books
-            ]
+                return [
+                    {
+                        "bookId": row[0],
+                        "title": row[1],
+                        "author": row[2],
+                        "createdAt": row[3].isoformat() if row[3] else None,
+                        "updatedAt": row[4].isoformat() if row[4] else None,
+                        "totalPages": row[5] or 0,
+                        "totalChunks": row[6] or 0,
+                        "totalDuration": float(row[7]) if row[7] else 0,
+                    }
+                    for row in books
+                ]
 
         except Exception as e:
             print(f"[MySQL] ❌ 사용자 책 목록 조회 실패: {e}")
             return []
-        finally:
-            session.close()
 
     @staticmethod
     def health_check() -> bool:
         """데이터베이스 연결 상태 확인"""
         try:
-            session = SessionLocal()
-            session.execute(text("SELECT 1"))
-            session.close()
+            with session_scope() as session:
+                session.execute(text("SELECT 1"))
             return True
         except Exception as e:
             print(f"[MySQL] 헬스체크 실패: {e}")
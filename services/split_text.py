@@ -1,29 +1,15 @@
-import nltk, os
-from pprint import pprint
+import re
 from config import MAX_SEGMENT_SIZE, OVERLAP_SIZE
 from typing import Generator, Tuple, List
-from nltk.tokenize import sent_tokenize
 from utils.logger import log
 
-NLTK_DIR = os.path.join(os.path.dirname(__file__), "..", "nltk_data")
-nltk.data.path.append(NLTK_DIR)      # 프로젝트 안 캐시 경로 추가
-
-def ensure_punkt() -> None:
-    """punkt 토크나이저가 없으면 다운로드한다(최초 1회)."""
-    try:
-        nltk.data.find("tokenizers/punkt")
-        print("NLTK 'punkt' 확인 완료.")
-    except LookupError:
-        print("NLTK 'punkt' 다운로드 중...")
-        nltk.download("punkt", download_dir=NLTK_DIR, quiet=True)
-        print("NLTK 'punkt' 다운로드 완료.")
-
-ensure_punkt()
-
 # 문장 경계 탐색 관련 상수
 SENTENCE_SEARCH_RATIO = 0.8  # 마지막 20% 구간만 검사
 LOOKAHEAD_CHARS = 200        # 문장 끝을 찾기 위한 여유 문자 수
 
+# 문장 종결부호(+닫는 따옴표/괄호) 뒤에 공백 또는 텍스트 끝이 오는 위치
+_SENTENCE_END_RE = re.compile(r"[.!?。！？]+[\"'”’)\]」』]*(?=\s|$)")
+
 
 def _find_sentence_boundary(
     text: str,
@@ -37,32 +23,24 @@ def _find_sentence_boundary(
         start_pos
     )
     search_end = min(initial_end_pos + LOOKAHEAD_CHARS, max_end_pos)
-    search_text = text[search_start:search_end]
-    
-    try:
-        sentences = sent_tokenize(search_text)
-        if not sentences:
-            return initial_end_pos
-        
-        # 뒤에서부터 완전한 문장 끝 찾기
-        for sentence in reversed(sentences):
-            sentence_pos = search_text.rfind(sentence)
-            if sentence_pos == -1:
-                continue
-            
-            # 절대 위치 계산
-            absolute_end = search_start + sentence_pos + len(sentence)
-            
-            # 유효 범위 내에 있는지 확인
-            if start_pos < absolute_end <= start_pos + MAX_SEGMENT_SIZE:
-                return absolute_end
-        
-        return initial_end_pos
-        
-    except Exception as e:
-        log(f"문장 토큰화 오류(무시): {e}")
+
+    # 세그먼트 최대 길이를 넘는 문장 끝은 사용할 수 없음
+    limit = min(search_end, start_pos + MAX_SEGMENT_SIZE)
+    if limit <= search_start:
         return initial_end_pos
 
+    # 정규식 엔진(C)으로 한 번 훑으며 마지막 문장 끝을 찾음
+    # (lookahead가 limit 바로 다음 글자를 볼 수 있도록 1글자 여유를 둠)
+    absolute_end = initial_end_pos
+    for match in _SENTENCE_END_RE.finditer(text, search_start, min(limit + 1, len(text))):
+        end = match.end()
+        if end > limit:
+            break
+        if end > start_pos:
+            absolute_end = end
+
+    return absolute_end
+
 
 def split_text_into_processing_segments(text: str) -> Generator[Tuple[str, int], None, None]:
     """
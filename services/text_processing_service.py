@@ -4,6 +4,14 @@ from ebooklib import epub
 from bs4 import BeautifulSoup
 from fastapi import UploadFile, HTTPException
 import io
+import os
+import tempfile
+
+try:
+    import lxml  # noqa: F401  prefer the C-backed parser when installed
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 class TextProcessingService:
     @staticmethod
@@ -35,39 +43,50 @@ class TextProcessingService:
     def _extract_from_pdf(content: bytes) -> str:
         try:
             doc = fitz.open(stream=content, filetype="pdf")
-            text = []
-            for page in doc:
-                text.append(page.get_text())
-            return "\n".join(text)
+            try:
+                # Write pages straight into one buffer instead of list + join.
+                buf = io.StringIO()
+                for i, page in enumerate(doc):
+                    if i:
+                        buf.write("\n")
+                    buf.write(page.get_text())
+                return buf.getvalue()
+            finally:
+                doc.close()
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Failed to parse PDF: {str(e)}")
 
     @staticmethod
     def _extract_from_epub(content: bytes) -> str:
         try:
-            # ebooklib requires a file path or file-like object. 
-            # We can write to a temporary file or try to use BytesIO if supported (ebooklib might be picky).
-            # Writing to a temp file is safer for ebooklib.
-            import tempfile
-            import os
-            
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".epub") as tmp:
-                tmp.write(content)
-                tmp_path = tmp.name
-            
+            # Newer ebooklib accepts file-like objects; try in-memory first.
             try:
-                book = epub.read_epub(tmp_path)
-                text = []
-                for item in book.get_items():
-                    if item.get_type() == ebooklib.ITEM_DOCUMENT:
-                        soup = BeautifulSoup(item.get_content(), 'html.parser')
-                        text.append(soup.get_text())
-                return "\n".join(text)
-            finally:
-                if os.path.exists(tmp_path):
-                    os.remove(tmp_path)
-                    
+                book = epub.read_epub(io.BytesIO(content))
+            except TypeError:
+                book = TextProcessingService._read_epub_via_tempfile(content)
+
+            text = []
+            for item in book.get_items():
+                if item.get_type() == ebooklib.ITEM_DOCUMENT:
+                    soup = BeautifulSoup(item.get_content(), HTML_PARSER)
+                    text.append(soup.get_text())
+            return "\n".join(text)
+
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Failed to parse EPUB: {str(e)}")
 
+    @staticmethod
+    def _read_epub_via_tempfile(content: bytes):
+        """Fallback for ebooklib versions that need a path (uses /dev/shm on Linux)."""
+        tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        with tempfile.NamedTemporaryFile(dir=tmp_dir, delete=False, suffix=".epub") as tmp:
+            tmp.write(content)
+            tmp_path = tmp.name
+
+        try:
+            return epub.read_epub(tmp_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
 text_processing_service = TextProcessingService()
@@ -4,8 +4,10 @@ Type definitions for the music generation workflow.
 This module provides type-safe data structures following Clean Code principles.
 """
 
-from typing import TypedDict, List, Dict, Any, Optional, Literal
-from pydantic import BaseModel, Field, validator
+import operator
+from dataclasses import dataclass
+from typing import Annotated, TypedDict, List, Dict, Any, Optional, Literal
+from pydantic import BaseModel, ConfigDict, Field, field_validator, validator
 from enum import Enum
 
 
@@ -135,68 +137,90 @@ class ChunkMetadata(BaseModel):
 
 class EmotionAnalysisRequest(BaseModel):
     """Request for emotion analysis."""
-    segment: str = Field(..., min_length=10)
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
-    class Config:
-        frozen = True
+    segment: str = Field(..., min_length=10)
 
 
 class EmotionAnalysisResult(BaseModel):
     """Result of emotion analysis."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     emotional_phases: List[EmotionalPhase] = Field(
         default_factory=list,
         description="List of detected emotional transition points"
     )
 
-    @validator('emotional_phases')
+    @field_validator('emotional_phases', mode='after')
+    @classmethod
     def validate_phases(cls, v):
-        """Ensure phases are sorted by position."""
-        if not v:
-            return v
-
-        # Filter out phases without position
-        valid_phases = [p for p in v if p.position_in_full_text is not None]
-
-        # Sort by position
-        valid_phases.sort(key=lambda x: x.position_in_full_text)
-
-        return valid_phases
+        """Ensure phases are sorted by position (phases without one are dropped)."""
+        return sorted(
+            (p for p in v if p.position_in_full_text is not None),
+            key=operator.attrgetter('position_in_full_text')
+        )
 
 
 class MusicGenerationRequest(BaseModel):
     """Request for music generation."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     chunks: List[TextChunk]
     book_dir: str
     global_prompt: str
 
-    class Config:
-        frozen = True
 
+@dataclass(slots=True)
+class EmotionAnalysisRow:
+    """
+    Emotion analysis outcome for one physical chunk.
 
-class WorkflowResult(BaseModel):
-    """Final result of the workflow execution."""
+    Keeps the EmotionAnalysisResult model itself instead of a dict dump,
+    so downstream steps read the phases without re-building them.
+    """
+    chunk_index: int
+    text: str
+    analysis: Optional[EmotionAnalysisResult]
+    error: Optional[str]
+    success: bool
+
+
+class WorkflowResult(TypedDict):
+    """
+    Final result of the workflow execution.
+
+    TypedDict rather than a model: run_workflow returns it straight to the
+    router, so building it is a plain dict literal with no validation pass.
+    """
     message: str
     book_id: str
-    text_length: int = Field(..., ge=0)
-    total_pages: int = Field(..., ge=0)
-    total_chunks: int = Field(..., ge=0)
-    total_duration: int = Field(..., ge=0)
-    successful_pages: int = Field(..., ge=0)
+    text_length: int
+    total_pages: int
+    total_chunks: int
+    total_duration: int
+    successful_pages: int
     pages: List[Dict[str, Any]]
-    processing_method: Literal["langgraph_workflow"] = "langgraph_workflow"
-    processing_times: Dict[str, float] = Field(default_factory=dict)
-    errors: List[str] = Field(default_factory=list)
+    processing_method: Literal["langgraph_refactored"]
+    processing_times: Dict[str, float]
+    total_time: float
+    errors: List[str]
 
 
 # ============================================================================
 # State Objects - Workflow State Management
 # ============================================================================
 
+def merge_dicts(left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+    """LangGraph reducer: merge a node's partial dict update into the channel."""
+    return {**left, **right}
+
+
 class WorkflowState(TypedDict, total=False):
     """
     State object for LangGraph workflow.
 
     Uses TypedDict for better IDE support and type checking.
+    Nodes return only the keys they change; LangGraph merges them into state.
     """
     # Input data
     text: str
@@ -207,30 +231,32 @@ class WorkflowState(TypedDict, total=False):
 
     # Intermediate processing results
     physical_chunks: List[str]
-    emotion_analyses: List[Dict[str, Any]]
-    final_chunks: List[Dict[str, Any]]
+    emotion_analyses: List[EmotionAnalysisRow]
+    final_chunks: List[TextChunk]
     chunk_metadata: List[Dict[str, Any]]
 
     # Final results
-    page_chunk_mapping: Dict[int, Dict[str, Any]]
+    total_pages: int
     page_results: List[Dict[str, Any]]
     total_duration: int
     successful_pages: int
 
     # Metadata
-    processing_times: Dict[str, float]
-    errors: List[str]
+    processing_times: Annotated[Dict[str, float], merge_dicts]
+    errors: Annotated[List[str], operator.add]
 
 
 # ============================================================================
 # Result Type - Functional Error Handling
 # ============================================================================
 
-class Result(BaseModel):
+@dataclass(slots=True)
+class Result:
     """
     Result type for functional error handling.
 
     Inspired by Rust's Result<T, E> pattern.
+    Plain dataclass: created on every step, and its fields need no validation.
     """
     success: bool
     data: Any = None
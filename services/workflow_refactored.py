@@ -13,12 +13,17 @@ Key Improvements:
 
 import asyncio
 import time
+from contextlib import aclosing
+from functools import lru_cache
+from itertools import chain
 from typing import Dict, Any, List, Optional
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END
 
 from services.types import (
     WorkflowState,
     WorkflowResult,
+    EmotionAnalysisRow,
     TextChunk,
     Result
 )
@@ -28,14 +33,16 @@ from services.chunk_processor import (
     split_text_by_phases,
     create_text_chunks,
     merge_small_chunks,
-    calculate_chunk_statistics
+    calculate_chunk_statistics,
+    is_valid_chunk
 )
 from services.split_text import split_text_with_sliding_window
-from services.async_music_generation import process_all_chunks_async
+from services.async_music_generation import iter_chunks_async
 from services.mysql_service import mysql_service
 from services import prompt_service
 from utils.logger import log
 from config import (
+    DEBUG,
     GEN_DURATION,
     CHUNKS_PER_PAGE,
     MAX_SEGMENT_SIZE,
@@ -43,6 +50,51 @@ from config import (
 )
 
 
+# Step names - shared by graph nodes, processing_times keys and error labels
+STEP_SPLIT_TEXT = "split_text"
+STEP_ANALYZE_AND_CHUNK = "analyze_and_chunk"
+STEP_GENERATE_AND_SAVE = "generate_and_save"
+STEP_CREATE_CHUNKS = "create_chunks"    # Error label within analyze_and_chunk
+STEP_GENERATE_MUSIC = "generate_music"  # Error label within generate_and_save
+STEP_SAVE_TO_DB = "save_to_db"          # Error label within generate_and_save
+
+
+class _StepTimer:
+    """
+    Context manager timing one workflow step on the monotonic ns clock.
+
+    `elapsed` (seconds) is fixed when the block exits; `times` is the
+    matching processing_times update for the node to return.
+    """
+    __slots__ = ("name", "elapsed", "_start")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.elapsed = 0.0
+
+    def __enter__(self) -> "_StepTimer":
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.elapsed = (time.perf_counter_ns() - self._start) / 1e9
+
+    @property
+    def times(self) -> Dict[str, float]:
+        """processing_times update for this step."""
+        return {self.name: self.elapsed}
+
+
+def _instance_node(method_name: str):
+    """Graph node that runs `method_name` on the workflow instance from the run config."""
+    async def node(state: WorkflowState, config: RunnableConfig) -> WorkflowState:
+        workflow = config["configurable"]["workflow"]
+        return await getattr(workflow, method_name)(state)
+
+    node.__name__ = method_name
+    return node
+
+
 class MusicGenerationWorkflowRefactored:
     """
     Refactored music generation workflow using Clean Architecture.
@@ -54,6 +106,8 @@ class MusicGenerationWorkflowRefactored:
     - Interface Segregation: Clear contracts between components
     """
 
+    __slots__ = ("emotion_service", "music_generator", "database_service", "graph")
+
     def __init__(
         self,
         emotion_service: Optional[EmotionAnalysisService] = None,
@@ -65,45 +119,46 @@ class MusicGenerationWorkflowRefactored:
 
         Args:
             emotion_service: Service for emotion analysis
-            music_generator: Service for music generation
+            music_generator: Async iterator of chunk metadata (in chunk order)
             database_service: Service for database operations
         """
         # Dependency injection with defaults
         self.emotion_service = emotion_service or EmotionAnalysisService()
-        self.music_generator = music_generator or process_all_chunks_async
+        self.music_generator = music_generator or iter_chunks_async
         self.database_service = database_service or mysql_service
 
+        # Compiled once per class; nodes reach this instance via the run config
         self.graph = self._build_graph()
 
     # ========================================================================
     # Graph Construction
     # ========================================================================
 
-    def _build_graph(self) -> StateGraph:
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _build_graph(cls) -> StateGraph:
         """
         Build the workflow graph with clear node definitions.
 
+        The graph is validated and compiled once and shared by all
+        instances; each node dispatches to the workflow instance passed
+        in `config["configurable"]["workflow"]` by run_workflow.
+
         Returns:
             Compiled LangGraph workflow
         """
         workflow = StateGraph(WorkflowState)
 
         # Add nodes - each with a single responsibility
-        workflow.add_node("split_text", self._split_text_node)
-        workflow.add_node("analyze_emotions", self._analyze_emotions_node)
-        workflow.add_node("create_chunks", self._create_chunks_node)
-        workflow.add_node("generate_music", self._generate_music_node)
-        workflow.add_node("create_pages", self._create_pages_node)
-        workflow.add_node("save_to_db", self._save_to_db_node)
+        workflow.add_node(STEP_SPLIT_TEXT, _instance_node("_split_text_node"))
+        workflow.add_node(STEP_ANALYZE_AND_CHUNK, _instance_node("_analyze_and_chunk_node"))
+        workflow.add_node(STEP_GENERATE_AND_SAVE, _instance_node("_generate_and_save_node"))
 
         # Define edges - workflow progression
-        workflow.set_entry_point("split_text")
-        workflow.add_edge("split_text", "analyze_emotions")
-        workflow.add_edge("analyze_emotions", "create_chunks")
-        workflow.add_edge("create_chunks", "generate_music")
-        workflow.add_edge("generate_music", "create_pages")
-        workflow.add_edge("create_pages", "save_to_db")
-        workflow.add_edge("save_to_db", END)
+        workflow.set_entry_point(STEP_SPLIT_TEXT)
+        workflow.add_edge(STEP_SPLIT_TEXT, STEP_ANALYZE_AND_CHUNK)
+        workflow.add_edge(STEP_ANALYZE_AND_CHUNK, STEP_GENERATE_AND_SAVE)
+        workflow.add_edge(STEP_GENERATE_AND_SAVE, END)
 
         return workflow.compile()
 
@@ -119,228 +174,156 @@ class MusicGenerationWorkflowRefactored:
         Input: Full text
         Output: List of physical chunks
         """
-        start_time = time.time()
-        log("📖 Step 1/6: Splitting text into segments")
-
-        result = await safe_execute_async(
-            self._split_text_logic,
-            state["text"],
-            error_message="Text splitting failed",
-            error_code=ErrorCode.TEXT_SPLIT_FAILED
-        )
+        log("📖 Step 1/3: Splitting text into segments")
+
+        with _StepTimer(STEP_SPLIT_TEXT) as timer:
+            result = await safe_execute_async(
+                self._split_text_logic,
+                state["text"],
+                error_message="Text splitting failed",
+                error_code=ErrorCode.TEXT_SPLIT_FAILED
+            )
 
         if result.is_err():
-            return self._handle_error(state, "split_text", result.error)
+            return self._handle_error(STEP_SPLIT_TEXT, result.error)
 
         physical_chunks = result.unwrap()
-        elapsed = time.time() - start_time
 
-        log(f"✅ Text split: {len(physical_chunks)} segments ({elapsed:.2f}s)")
+        log(f"✅ Text split: {len(physical_chunks)} segments ({timer.elapsed:.2f}s)")
 
         return {
-            **state,
             "physical_chunks": physical_chunks,
-            "processing_times": {
-                **state.get("processing_times", {}),
-                "split_text": elapsed
-            }
+            "processing_times": timer.times
         }
 
-    async def _analyze_emotions_node(self, state: WorkflowState) -> WorkflowState:
+    async def _analyze_and_chunk_node(self, state: WorkflowState) -> WorkflowState:
         """
-        Node 2: Analyze emotions in each physical chunk.
+        Node 2: Analyze emotions and create final chunks.
 
-        Responsibility: Emotion detection only
+        Responsibility: Emotion detection and chunk creation
         Input: Physical chunks
-        Output: Emotion analysis results
-        """
-        start_time = time.time()
-        chunks = state.get("physical_chunks", [])
-
-        log(f"🎭 Step 2/6: Analyzing emotions in {len(chunks)} segments")
-
-        # Batch analysis with the service
-        results = await self.emotion_service.analyze_batch(chunks)
-
-        # Convert Results to compatible format
-        emotion_analyses = []
-        for i, result in enumerate(results):
-            if result.is_ok():
-                analysis_result = result.unwrap()
-                emotion_analyses.append({
-                    "chunk_index": i,
-                    "text": chunks[i],
-                    "analysis": analysis_result.dict(),
-                    "success": True
-                })
-            else:
-                emotion_analyses.append({
-                    "chunk_index": i,
-                    "text": chunks[i],
-                    "error": result.error,
-                    "success": False
-                })
-
-        elapsed = time.time() - start_time
-        successful = sum(1 for a in emotion_analyses if a["success"])
-
-        log(f"✅ Emotion analysis: {successful}/{len(chunks)} successful ({elapsed:.2f}s)")
-
-        return {
-            **state,
-            "emotion_analyses": emotion_analyses,
-            "processing_times": {
-                **state.get("processing_times", {}),
-                "analyze_emotions": elapsed
-            }
-        }
-
-    async def _create_chunks_node(self, state: WorkflowState) -> WorkflowState:
-        """
-        Node 3: Create final chunks based on emotion analysis.
+        Output: Emotion analysis results and final text chunks with context
 
-        Responsibility: Chunk creation and merging
-        Input: Emotion analyses
-        Output: Final text chunks with context
+        Analyses stream in as they complete, and each segment is chunked
+        immediately, so chunk creation overlaps with the remaining LLM calls.
         """
-        start_time = time.time()
-        log("✂️ Step 3/6: Creating final chunks from emotion analysis")
-
-        result = await safe_execute_async(
-            self._create_chunks_logic,
-            state.get("emotion_analyses", []),
-            error_message="Chunk creation failed",
-            error_code=ErrorCode.INVALID_CHUNK_DATA
-        )
-
-        if result.is_err():
-            return self._handle_error(state, "create_chunks", result.error)
-
-        final_chunks = result.unwrap()
-        elapsed = time.time() - start_time
-
-        # Calculate statistics
-        stats = calculate_chunk_statistics(final_chunks)
-
-        log(f"✅ Chunks created: {stats['total_chunks']} chunks")
-        log(f"   - Avg size: {stats['average_size']} chars")
-        log(f"   - Range: {stats['min_size']}-{stats['max_size']} chars")
-        log(f"   - Time: {elapsed:.2f}s")
+        segments = state.get("physical_chunks", [])
+
+        log(f"🎭 Step 2/3: Analyzing emotions in {len(segments)} segments "
+            f"(creating chunks as analyses complete)")
+
+        # Indexed by segment so results can land in completion order
+        emotion_analyses: List[Optional[EmotionAnalysisRow]] = [None] * len(segments)
+        segment_chunks: List[List[TextChunk]] = [[] for _ in segments]
+
+        with _StepTimer(STEP_ANALYZE_AND_CHUNK) as timer:
+            async with aclosing(self.emotion_service.analyze_stream(segments)) as stream:
+                async for i, result in stream:
+                    analysis = EmotionAnalysisRow(
+                        chunk_index=i,
+                        text=segments[i],
+                        analysis=result.unwrap_or(None),
+                        error=result.error,
+                        success=result.is_ok()
+                    )
+                    emotion_analyses[i] = analysis
+
+                    chunk_result = await safe_execute_async(
+                        self._create_chunks_logic,
+                        [analysis],
+                        error_message="Chunk creation failed",
+                        error_code=ErrorCode.INVALID_CHUNK_DATA
+                    )
+
+                    if chunk_result.is_err():
+                        return self._handle_error(STEP_CREATE_CHUNKS, chunk_result.error)
+
+                    segment_chunks[i] = chunk_result.unwrap()
+
+        final_chunks = list(chain.from_iterable(segment_chunks))
+        successful = sum(1 for a in emotion_analyses if a.success)
+
+        log(f"✅ Emotion analysis: {successful}/{len(segments)} successful")
+        log(f"✅ Chunks created: {len(final_chunks)} chunks")
+
+        # Statistics are diagnostics only - skip the extra pass unless logging
+        if DEBUG:
+            stats = calculate_chunk_statistics(final_chunks)
+            log(f"   - Avg size: {stats['average_size']} chars")
+            log(f"   - Range: {stats['min_size']}-{stats['max_size']} chars")
+        log(f"   - Time: {timer.elapsed:.2f}s")
 
         return {
-            **state,
-            "final_chunks": [chunk.dict() for chunk in final_chunks],
-            "processing_times": {
-                **state.get("processing_times", {}),
-                "create_chunks": elapsed
-            }
+            "emotion_analyses": emotion_analyses,
+            "final_chunks": final_chunks,
+            "processing_times": timer.times
         }
 
-    async def _generate_music_node(self, state: WorkflowState) -> WorkflowState:
+    async def _generate_and_save_node(self, state: WorkflowState) -> WorkflowState:
         """
-        Node 4: Generate music for each chunk.
+        Node 3: Generate music and persist pages as they complete.
 
-        Responsibility: Music generation only
+        Responsibility: Pipeline music generation with page persistence
         Input: Final chunks
-        Output: Chunk metadata with music files
-        """
-        start_time = time.time()
-        chunks = state.get("final_chunks", [])
-
-        log(f"🎵 Step 4/6: Generating music for {len(chunks)} chunks")
-
-        # Generate global prompt
-        global_prompt = prompt_service.generate_global(state["text"])
-
-        # Generate music for all chunks
-        chunk_metadata = await self.music_generator(
-            chunks,
-            state["book_dir"],
-            global_prompt
-        )
-
-        elapsed = time.time() - start_time
-
-        log(f"✅ Music generated: {len(chunk_metadata)} tracks ({elapsed:.2f}s)")
+        Output: Chunk metadata, page mapping and page results
 
-        return {
-            **state,
-            "chunk_metadata": chunk_metadata,
-            "processing_times": {
-                **state.get("processing_times", {}),
-                "generate_music": elapsed
-            }
-        }
-
-    async def _create_pages_node(self, state: WorkflowState) -> WorkflowState:
-        """
-        Node 5: Create page mappings from chunks.
-
-        Responsibility: Page organization
-        Input: Chunk metadata
-        Output: Page chunk mapping
+        Music generation produces pages into a queue while a concurrent
+        saver drains it, so DB latency is hidden behind generation.
         """
-        start_time = time.time()
-        log("📄 Step 5/6: Creating page mappings")
-
-        result = await safe_execute_async(
-            self._create_page_mapping_logic,
-            state.get("chunk_metadata", []),
-            error_message="Page mapping failed"
-        )
-
-        if result.is_err():
-            return self._handle_error(state, "create_pages", result.error)
+        chunks = state.get("final_chunks", [])
 
-        page_mapping = result.unwrap()
-        elapsed = time.time() - start_time
+        log(f"🎵 Step 3/3: Generating music for {len(chunks)} chunks (saving pages as they complete)")
 
-        log(f"✅ Pages organized: {len(page_mapping)} pages ({elapsed:.2f}s)")
+        with _StepTimer(STEP_GENERATE_AND_SAVE) as timer:
+            # Generate global prompt
+            global_prompt = prompt_service.generate_global(state["text"])
 
-        return {
-            **state,
-            "page_chunk_mapping": page_mapping,
-            "processing_times": {
-                **state.get("processing_times", {}),
-                "create_pages": elapsed
-            }
-        }
+            # Consumer: saves pages while music is still being generated
+            page_queue: asyncio.Queue = asyncio.Queue()
+            saver = asyncio.create_task(safe_execute_async(
+                self._save_to_database_logic,
+                page_queue,
+                state["book_id"],
+                state["book_title"],
+                error_message="Database save failed",
+                error_code=ErrorCode.DATABASE_WRITE_FAILED
+            ))
 
-    async def _save_to_db_node(self, state: WorkflowState) -> WorkflowState:
-        """
-        Node 6: Save results to database.
-
-        Responsibility: Data persistence
-        Input: Page mapping and metadata
-        Output: Page results
-        """
-        start_time = time.time()
-        log("💾 Step 6/6: Saving to database")
-
-        result = await safe_execute_async(
-            self._save_to_database_logic,
-            state,
-            error_message="Database save failed",
-            error_code=ErrorCode.DATABASE_WRITE_FAILED
-        )
+            # Producer: generates music and hands over each completed page
+            try:
+                music_result = await safe_execute_async(
+                    self._generate_pages_logic,
+                    chunks,
+                    state["book_dir"],
+                    global_prompt,
+                    page_queue,
+                    error_message="Music generation failed",
+                    error_code=ErrorCode.MUSIC_GENERATION_FAILED
+                )
+            finally:
+                # End of pages - also sent on cancellation so the saver never hangs
+                page_queue.put_nowait(None)
+                save_result = await saver
 
-        if result.is_err():
-            return self._handle_error(state, "save_to_db", result.error)
+        if music_result.is_err():
+            return self._handle_error(STEP_GENERATE_MUSIC, music_result.error)
+        if save_result.is_err():
+            return self._handle_error(STEP_SAVE_TO_DB, save_result.error)
 
-        page_results, total_duration, successful_pages = result.unwrap()
-        elapsed = time.time() - start_time
+        chunk_metadata = music_result.unwrap()
+        page_results, total_duration, successful_pages = save_result.unwrap()
+        total_pages = (len(chunk_metadata) + CHUNKS_PER_PAGE - 1) // CHUNKS_PER_PAGE
 
-        log(f"✅ Database save: {successful_pages} pages saved ({elapsed:.2f}s)")
+        log(f"✅ Music generated: {len(chunk_metadata)} tracks, "
+            f"{successful_pages}/{total_pages} pages saved ({timer.elapsed:.2f}s)")
 
         return {
-            **state,
+            "chunk_metadata": chunk_metadata,
+            "total_pages": total_pages,
             "page_results": page_results,
             "total_duration": total_duration,
             "successful_pages": successful_pages,
-            "processing_times": {
-                **state.get("processing_times", {}),
-                "save_to_db": elapsed
-            }
+            "processing_times": timer.times
         }
 
     # ========================================================================
@@ -357,119 +340,133 @@ class MusicGenerationWorkflowRefactored:
 
     async def _create_chunks_logic(
         self,
-        emotion_analyses: List[Dict[str, Any]]
+        emotion_analyses: List[EmotionAnalysisRow]
     ) -> List[TextChunk]:
         """Business logic for chunk creation."""
-        all_chunks = []
-
-        for analysis in emotion_analyses:
-            if not analysis.get("success"):
-                continue
-
-            text = analysis["text"]
-            phases_data = analysis["analysis"].get("emotional_phases", [])
-
-            if not phases_data:
-                # No phases - use whole chunk
-                from services.chunk_processor import is_valid_chunk
-                if is_valid_chunk(text):
-                    chunk = TextChunk(text=text, context={"emotions": "neutral"})
-                    all_chunks.append(chunk)
-                continue
-
-            # Convert to EmotionalPhase objects
-            from services.types import EmotionalPhase
-            phases = [EmotionalPhase(**p) for p in phases_data]
-
-            # Split by phases
-            raw_chunks = split_text_by_phases(text, phases)
-
-            # Merge small chunks
-            merged_chunks = merge_small_chunks(raw_chunks)
-
-            # Create TextChunk objects
-            text_chunks = create_text_chunks(merged_chunks)
-
-            all_chunks.extend(text_chunks)
-
-        return all_chunks
-
-    async def _create_page_mapping_logic(
+        return list(chain.from_iterable(
+            self._chunks_for(analysis)
+            for analysis in emotion_analyses
+            if analysis.success
+        ))
+
+    def _chunks_for(self, analysis: EmotionAnalysisRow) -> List[TextChunk]:
+        """Create the final chunks for one successfully analyzed segment."""
+        text = analysis.text
+        phases = analysis.analysis.emotional_phases
+
+        if not phases:
+            # No phases - use whole chunk
+            if not is_valid_chunk(text):
+                return []
+            # Trusted internal data: skip re-validation (strip mirrors the validator)
+            return [TextChunk.model_construct(
+                text=text.strip(),
+                context={"emotions": "neutral"}
+            )]
+
+        # Split by phases (EmotionalPhase models straight from the analysis)
+        raw_chunks = split_text_by_phases(text, phases)
+
+        # Merge small chunks
+        merged_chunks = merge_small_chunks(raw_chunks)
+
+        # Create TextChunk objects
+        return create_text_chunks(merged_chunks)
+
+    async def _generate_pages_logic(
         self,
-        chunk_metadata: List[Dict[str, Any]]
-    ) -> Dict[int, Dict[str, Any]]:
-        """Business logic for page mapping creation."""
-        page_mapping = {}
+        chunks: List[TextChunk],
+        book_dir: str,
+        global_prompt: str,
+        page_queue: asyncio.Queue
+    ) -> List[Dict[str, Any]]:
+        """
+        Business logic for music generation and page assignment.
+
+        Pages are contiguous runs of CHUNKS_PER_PAGE chunks, so a chunk's
+        page number is derived from its index; no page mapping is kept.
+        """
+        chunk_metadata = []
+        page_chunks = []
+        page_num = 0
 
-        for i, chunk in enumerate(chunk_metadata):
-            page_num = (i // CHUNKS_PER_PAGE) + 1
+        async with aclosing(self.music_generator(chunks, book_dir, global_prompt)) as stream:
+            async for chunk in stream:
+                page_num = len(chunk_metadata) // CHUNKS_PER_PAGE + 1
+                chunk["page"] = page_num
+                chunk_metadata.append(chunk)
+                page_chunks.append(chunk)
 
-            if page_num not in page_mapping:
-                page_mapping[page_num] = {
-                    "start_index": i + 1,
-                    "end_index": i + 1,
-                    "chunk_count": 0
-                }
+                # Page complete - hand it to the saver right away
+                if len(page_chunks) == CHUNKS_PER_PAGE:
+                    page_queue.put_nowait((page_num, page_chunks))
+                    page_chunks = []
 
-            page_mapping[page_num]["end_index"] = i + 1
-            page_mapping[page_num]["chunk_count"] += 1
-            chunk["page"] = page_num
+        if page_chunks:
+            page_queue.put_nowait((page_num, page_chunks))
 
-        return page_mapping
+        return chunk_metadata
 
     async def _save_to_database_logic(
         self,
-        state: WorkflowState
+        page_queue: asyncio.Queue,
+        book_id: str,
+        book_title: str
     ) -> tuple[List[Dict[str, Any]], int, int]:
-        """Business logic for database persistence."""
-        page_mapping = state["page_chunk_mapping"]
-        chunk_metadata = state["chunk_metadata"]
-        book_id = state["book_id"]
-        book_title = state["book_title"]
+        """
+        Business logic for database persistence.
 
+        Consumes (page_num, page_chunks) items until a None sentinel.
+        Pages that queued up while a save was in flight are written
+        together in one bulk transaction.
+        """
         page_results = []
-
-        for page_num, mapping in page_mapping.items():
-            start_idx = mapping["start_index"] - 1
-            end_idx = mapping["end_index"]
-            page_chunks = chunk_metadata[start_idx:end_idx]
-
-            if not page_chunks:
-                page_results.append({
-                    "page": page_num,
-                    "chunks": 0,
-                    "duration": 0,
-                    "error": "No chunks"
-                })
+        total_duration = 0
+        successful_pages = 0
+        finished = False
+
+        while not finished:
+            batch = [await page_queue.get()]
+            while not page_queue.empty():
+                batch.append(page_queue.get_nowait())
+
+            if batch[-1] is None:
+                batch.pop()
+                finished = True
+            if not batch:
                 continue
 
-            page_duration = len(page_chunks) * GEN_DURATION
+            pages_payload = [
+                (page_num, page_chunks, len(page_chunks) * GEN_DURATION)
+                for page_num, page_chunks in batch
+            ]
 
+            # The DB driver is blocking, so run it off the event loop.
             try:
-                self.database_service.save_chapter_chunks(
+                await asyncio.to_thread(
+                    self.database_service.save_chapter_chunks_bulk,
                     book_id=book_id,
-                    page=page_num,
-                    chunks=page_chunks,
-                    total_duration=page_duration,
+                    pages=pages_payload,
                     book_title=book_title
                 )
 
-                page_results.append({
-                    "page": page_num,
-                    "chunks": len(page_chunks),
-                    "duration": page_duration,
-                    "cached": False
-                })
+                for page_num, page_chunks, page_duration in pages_payload:
+                    page_results.append({
+                        "page": page_num,
+                        "chunks": len(page_chunks),
+                        "duration": page_duration,
+                        "cached": False
+                    })
+                    total_duration += page_duration
+                    successful_pages += 1
             except Exception as e:
-                log(f"❌ Failed to save page {page_num}: {e}")
-                page_results.append({
-                    "page": page_num,
-                    "error": str(e),
-                    "cached": False
-                })
-
-        total_duration = sum(p.get("duration", 0) for p in page_results)
-        successful_pages = len([p for p in page_results if "error" not in p])
+                log(f"❌ Failed to save pages {[p[0] for p in pages_payload]}: {e}")
+                for page_num, _, _ in pages_payload:
+                    page_results.append({
+                        "page": page_num,
+                        "error": str(e),
+                        "cached": False
+                    })
 
         return page_results, total_duration, successful_pages
 
@@ -479,7 +476,6 @@ class MusicGenerationWorkflowRefactored:
 
     def _handle_error(
         self,
-        state: WorkflowState,
         step_name: str,
         error: str
     ) -> WorkflowState:
@@ -487,19 +483,15 @@ class MusicGenerationWorkflowRefactored:
         Handle errors in a consistent way.
 
         Args:
-            state: Current workflow state
             step_name: Name of the failing step
             error: Error message
 
         Returns:
-            Updated state with error recorded
+            State update with the error appended to the errors channel
         """
         log(f"❌ Error in {step_name}: {error}")
 
-        return {
-            **state,
-            "errors": state.get("errors", []) + [f"{step_name}: {error}"]
-        }
+        return {"errors": [f"{step_name}: {error}"]}
 
     # ========================================================================
     # Public API
@@ -512,7 +504,7 @@ class MusicGenerationWorkflowRefactored:
         book_title: str,
         book_id: str,
         book_dir: str
-    ) -> Dict[str, Any]:
+    ) -> WorkflowResult:
         """
         Execute the complete workflow.
 
@@ -529,7 +521,6 @@ class MusicGenerationWorkflowRefactored:
             WorkflowResult dictionary with all results and metrics
         """
         log("🚀 Starting refactored LangGraph workflow")
-        workflow_start = time.time()
 
         # Initialize state
         initial_state = WorkflowState(
@@ -542,7 +533,7 @@ class MusicGenerationWorkflowRefactored:
             emotion_analyses=[],
             final_chunks=[],
             chunk_metadata=[],
-            page_chunk_mapping={},
+            total_pages=0,
             page_results=[],
             total_duration=0,
             successful_pages=0,
@@ -551,10 +542,13 @@ class MusicGenerationWorkflowRefactored:
         )
 
         # Execute workflow
-        final_state = await self.graph.ainvoke(initial_state)
+        with _StepTimer("total") as workflow_timer:
+            final_state = await self.graph.ainvoke(
+                initial_state,
+                config={"configurable": {"workflow": self}}
+            )
 
-        # Calculate total time
-        total_time = time.time() - workflow_start
+        total_time = workflow_timer.elapsed
 
         log(f"🎉 Workflow complete in {total_time:.2f}s")
         self._log_performance_summary(final_state["processing_times"])
@@ -564,7 +558,7 @@ class MusicGenerationWorkflowRefactored:
             "message": f"{book_title} 음악 생성 완료 (Refactored)",
             "book_id": book_id,
             "text_length": len(text),
-            "total_pages": len(final_state.get("page_chunk_mapping", {})),
+            "total_pages": final_state.get("total_pages", 0),
             "total_chunks": len(final_state.get("chunk_metadata", [])),
             "total_duration": final_state.get("total_duration", 0),
             "successful_pages": final_state.get("successful_pages", 0),
@@ -601,7 +595,7 @@ def create_workflow(
 
     Args:
         emotion_service: Custom emotion analysis service
-        music_generator: Custom music generation service
+        music_generator: Custom music generation stream
         database_service: Custom database service
 
     Returns:
@@ -1,11 +1,14 @@
 """공통 유틸리티 함수들"""
-import os
-import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Tuple
 from pathlib import Path
-from utils.file_utils import save_text_to_file, ensure_dir, secure_filename
+from utils.file_utils import save_text_to_file, secure_filename
 from services import chunk_text_by_emotion, prompt_service
-from config import OUTPUT_DIR
+from config import OUTPUT_DIR, MAX_CONCURRENT_PROMPT_GENERATION
+
+# OUTPUT_DIR은 상수이므로 Path 객체도 한 번만 만든다
+_OUTPUT_PATH = Path(OUTPUT_DIR)
 
 
 def process_text_chunks(text: str, tmp_path: str) -> List[Tuple[str, Dict[str, Any]]]:
@@ -16,16 +19,24 @@ def process_text_chunks(text: str, tmp_path: str) -> List[Tuple[str, Dict[str, A
 
 def generate_music_prompts(text: str, chunks: List[Tuple[str, Dict[str, Any]]], 
                           preference: List[str] = None) -> Tuple[str, List[str]]:
-    """글로벌 및 지역 음악 프롬프트 생성"""
-    global_prompt = prompt_service.generate_global(text)
+    """글로벌 및 지역 음악 프롬프트 생성 (LLM 호출은 스레드 풀에서 동시에 실행)"""
+    # 청크 목록은 한 함수가 만든 동일한 형태이므로 타입은 첫 원소로 한 번만 확인
+    if chunks and isinstance(chunks[0], (list, tuple)):
+        chunk_texts = [chunk[0] for chunk in chunks]
+    else:
+        chunk_texts = chunks
+    
+    # 글로벌 프롬프트와 지역 프롬프트 호출의 대기 시간을 겹쳐서 처리
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PROMPT_GENERATION) as executor:
+        global_future = executor.submit(prompt_service.generate_global, text)
+        regional_prompts = list(executor.map(prompt_service.generate_regional, chunk_texts))
+        global_prompt = global_future.result()
+    
     music_prompts = []
+    pref_line = f"User preference: {', '.join(preference)}" if preference else None
     
-    for chunk in chunks:
-        chunk_text = chunk[0] if isinstance(chunk, (list, tuple)) else chunk
-        regional = prompt_service.generate_regional(chunk_text)
-        
-        if preference:
-            pref_line = f"User preference: {', '.join(preference)}"
+    for regional in regional_prompts:
+        if pref_line:
             regional = f"{regional}\n{pref_line}"
             
         music_prompts.append(
@@ -37,8 +48,10 @@ def generate_music_prompts(text: str, chunks: List[Tuple[str, Dict[str, Any]]],
 
 def parse_preference(preference_str: str) -> List[str]:
     """선호도 JSON 문자열 파싱"""
+    if not preference_str:
+        return []
     try:
-        pref_list = json.loads(preference_str)
+        pref_list = orjson.loads(preference_str)
         if not isinstance(pref_list, list):
             raise ValueError("Not a list")
         return pref_list
@@ -49,13 +62,9 @@ def parse_preference(preference_str: str) -> List[str]:
 def setup_book_directory(user_id: str, book_title: str, page: int = None) -> Tuple[str, str]:
     """책 디렉토리 설정 및 경로 반환"""
     safe_title = secure_filename(book_title)
-    book_dir = os.path.join(user_id, safe_title)
-    abs_book_dir = os.path.join(OUTPUT_DIR, book_dir)
-    ensure_dir(abs_book_dir)
-    
-    if page is not None:
-        tmp_path = os.path.join(abs_book_dir, f"ch{page}_tmp.txt")
-    else:
-        tmp_path = os.path.join(abs_book_dir, "tmp.txt")
+    book_dir = Path(user_id) / safe_title
+    abs_book_dir = _OUTPUT_PATH / book_dir
+    abs_book_dir.mkdir(parents=True, exist_ok=True)
     
-    return book_dir, tmp_path
\ No newline at end of file
+    tmp_name = f"ch{page}_tmp.txt" if page is not None else "tmp.txt"
+    return str(book_dir), str(abs_book_dir / tmp_name)
\ No newline at end of file
@@ -1,10 +1,16 @@
 import re
 import os
+from functools import lru_cache
+from pathlib import Path
+import aiofiles
 
+# Windows/Linux/Mac에서 금지된 문자: < > : " / \ | ? *
+_FORBIDDEN_CHARS_RE = re.compile(r'[<>:"/\\|?*]+')
+
+@lru_cache(maxsize=4096)
 def secure_filename(book_title: str) -> str:
-    """파일 시스템에서 금지된 문자만 제거"""
-    # Windows/Linux/Mac에서 금지된 문자: < > : " / \ | ? *
-    book_title = re.sub(r'[<>:"/\\|?*]+', "_", book_title)
+    """파일 시스템에서 금지된 문자만 제거 (순수 함수라 같은 제목은 캐시에서 반환)"""
+    book_title = _FORBIDDEN_CHARS_RE.sub("_", book_title)
     # 공백도 언더스코어로
     book_title = book_title.replace(" ", "_")
     # 양 끝 정리
@@ -14,6 +20,14 @@ def secure_filename(book_title: str) -> str:
     return book_title
 
 def ensure_dir(directory: str) -> None:
-    """디렉토리가 존재하지 않으면 생성"""
-    if not os.path.exists(directory):
-        os.makedirs(directory, exist_ok=True)
+    """디렉토리가 존재하지 않으면 생성 (이미 있으면 그대로 둠)"""
+    os.makedirs(directory, exist_ok=True)
+
+def save_text_to_file(path: str, text: str) -> None:
+    """텍스트를 UTF-8 파일로 저장 (바이너리로 바로 기록해 TextIOWrapper를 거치지 않음)"""
+    Path(path).write_bytes(text.encode("utf-8"))
+
+async def save_text_to_file_async(path: str, text: str) -> None:
+    """텍스트를 UTF-8 파일로 저장 (이벤트 루프를 막지 않도록 aiofiles 스레드에서 기록)"""
+    async with aiofiles.open(path, mode="wb") as f:
+        await f.write(text.encode("utf-8"))
@@ -1,8 +1,13 @@
 """대용량 파일을 위한 스트리밍 처리 유틸리티"""
 import os
+import re
 from typing import Generator, Iterator
+from charset_normalizer import detect
 from utils.logger import log
 
+# 청크의 마지막 문장 종결 부호 (뒤에 다른 종결 부호가 없는 것) - 한 번의 search로 찾음
+_LAST_SENTENCE_END_RE = re.compile(r"[.!?。！？](?=[^.!?。！？]*\Z)")
+
 
 def read_file_in_chunks(file_path: str, chunk_size: int = 8192) -> Generator[str, None, None]:
     """파일을 청크 단위로 스트리밍 읽기"""
@@ -30,36 +35,36 @@ def process_large_text_streaming(file_path: str, max_memory_mb: int = 100) -> It
     else:
         # 큰 파일은 청크 단위 처리
         log(f"대용량 파일 감지 ({file_size:,} bytes): 스트리밍 모드")
-        buffer = ""
-        sentence_endings = ['.', '!', '?', '。', '！', '？']
+        # 문장 경계 이전의 미완성 조각들 - 버퍼 문자열을 키우지 않고 리스트로 보관
+        pending: list[str] = []
         
         for chunk in read_file_in_chunks(file_path, 4096):
-            buffer += chunk
+            # 새로 읽은 청크에서만 마지막 문장 경계를 찾음 (이전 내용 재스캔 없음)
+            last_end = _LAST_SENTENCE_END_RE.search(chunk)
+            if last_end is None:
+                pending.append(chunk)
+                continue
+            boundary = last_end.end()
             
-            # 문장 경계에서 yield
-            for ending in sentence_endings:
-                if ending in buffer:
-                    sentences = buffer.split(ending)
-                    for i in range(len(sentences) - 1):
-                        yield sentences[i] + ending
-                    buffer = sentences[-1]
-                    break
+            # 문장 경계까지 yield, 나머지는 다음 청크로 넘김
+            pending.append(chunk[:boundary])
+            yield "".join(pending)
+            pending = [chunk[boundary:]]
         
         # 남은 버퍼 처리
-        if buffer.strip():
-            yield buffer
+        tail = "".join(pending)
+        if tail.strip():
+            yield tail
 
 
 def get_file_info(file_path: str) -> dict:
     """파일 정보 반환 (크기, 인코딩 추정 등)"""
-    import chardet
-    
     file_size = os.path.getsize(file_path)
     
     # 인코딩 추정 (처음 1KB만 사용)
     with open(file_path, 'rb') as f:
         raw_data = f.read(min(1024, file_size))
-        encoding_info = chardet.detect(raw_data)
+        encoding_info = detect(raw_data)
     
     return {
         "size_bytes": file_size,